@@ -1,10 +1,19 @@
 # Standard library imports
 import os
+import errno
+import functools
 import shutil
 import mimetypes
+import io
 import zipfile
+import threading
+import queue
+import time
+import contextlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Tuple, Iterator, Iterable, Callable, Union
 from datetime import datetime
 
 # Third-party imports for console UI
@@ -12,156 +21,734 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
 import json
 
+# Optional faster JSON encoder for the operations log
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size used when streaming extracted zip members to disk
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Read buffer for zip archives; member headers and small members are served
+# from memory instead of one small read each
+_ZIP_READ_BUFFER_SIZE = 4 << 20
+
+# Worker threads used for file moves; rename() releases the GIL
+_MOVE_WORKERS = 16
+
+# Moves submitted but not yet finished; keeps the executor's work queue (one
+# Future per file) from growing with the size of the tree, and limits how much
+# work still runs after Ctrl-C
+_MAX_PENDING_MOVES = _MOVE_WORKERS * 4
+
+# Worker threads used for zip extraction; zlib releases the GIL while inflating
+_UNZIP_WORKERS = min(8, os.cpu_count() or 4)
+
+# Archives holding at least this much uncompressed data are extracted by several
+# threads at once, each reading its own contiguous share of the members. Only one
+# archive at a time is split this way, so at most _MEMBER_WORKERS extra threads
+# (and read buffers) exist on top of the unzip pool.
+_PARALLEL_MEMBER_BYTES = 256 << 20
+_MEMBER_WORKERS = min(4, os.cpu_count() or 1)
+_parallel_extract_lock = threading.Lock()
+
+# Minimum seconds between progress bar updates from per-file loops
+_PROGRESS_INTERVAL = 0.032
+
+
+def _encode_log_line(entry: Dict) -> bytes:
+    """
+    Encode one operations log entry as a compact JSON line.
+    
+    Uses orjson when it is installed, and the standard library otherwise.
+    
+    Args:
+        entry (Dict): Log entry to encode
+        
+    Returns:
+        bytes: UTF-8 encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. file names with undecodable bytes; json escapes those
+            pass
+    return (json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+
+@functools.lru_cache(maxsize=256)
+def _mime_is_media(suffix_lower: str) -> bool:
+    """
+    Check whether the MIME type guessed for a file suffix is video, audio or image.
+    
+    mimetypes.guess_type only looks at the suffix, so results are cached per
+    suffix rather than per file. The cache is bounded because names with a dot
+    in the middle (e.g. 'notes.v2 final') produce one-off suffixes.
+    
+    Args:
+        suffix_lower (str): Lowercase file suffix including the dot, e.g. '.webm'
+        
+    Returns:
+        bool: True if the suffix maps to a media MIME type
+    """
+    mime_type, _ = mimetypes.guess_type('file' + suffix_lower)
+    return bool(mime_type) and mime_type.startswith(('video/', 'audio/', 'image/'))
+
+def _scandir_recursive(path: Union[str, Path], skip_dirs: Set[str] = frozenset(),
+                       onerror: Callable[[OSError], None] = None) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield a directory entry for every regular file under a path.
+    
+    Uses os.scandir so file type checks come from the directory listing itself,
+    and the entry caches its stat result. Directories are walked from an explicit
+    stack rather than nested generators, so deep trees neither hit the recursion
+    limit nor pass every entry up through one generator per level, and only one
+    directory handle is open at a time. Symbolic links are skipped, and so are
+    directories that cannot be read (such as '.Trashes' on a macOS volume root),
+    like rglob and os.walk do.
+    
+    Args:
+        path (str | Path): Directory to walk
+        skip_dirs (Set[str], optional): Absolute paths of directories not to descend into
+        onerror (Callable[[OSError], None], optional): Called with the error for
+            each directory that could not be read
+        
+    Yields:
+        os.DirEntry: Entry for each regular file found
+    """
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune skipped subtrees before listing them
+                        if skip_dirs and os.path.abspath(entry.path) in skip_dirs:
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            # Skip unreadable directories instead of aborting the whole walk
+            if onerror is not None:
+                onerror(e)
+
+def _kernel_copy(src: str, dst: str) -> bool:
+    """
+    Copy file contents inside the kernel with os.copy_file_range.
+    
+    Avoids copying through user-space buffers, and lets filesystems that
+    support it share extents instead of duplicating data. Some kernels and
+    filesystems report 0 bytes without copying anything, so the result must
+    be checked before the source is removed.
+    
+    Args:
+        src (str): File to copy
+        dst (str): Destination file path (created or truncated)
+        
+    Returns:
+        bool: True if the whole file was copied, False if another method is needed
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        while True:
+            sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+            if not sent:
+                break
+            copied += sent
+    # A first call returning 0 means nothing was copied, even for empty files
+    return copied > 0 and copied == size
+
+def _cross_device_move(src: str, dst: str) -> None:
+    """
+    Move a file to another filesystem by copying it and removing the original.
+    
+    Args:
+        src (str): File to move
+        dst (str): Destination file path
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            # Copy in the kernel, then drop the original once the copy is complete
+            if _kernel_copy(src, dst):
+                shutil.copystat(src, dst)
+                os.unlink(src)
+                return
+        except OSError:
+            # Not supported between these filesystems; fall through to shutil
+            pass
+    # copy2 still copies in the kernel where it can (sendfile on Linux,
+    # fcopyfile on macOS); unlike shutil.move it does not retry the rename
+    shutil.copy2(src, dst)
+    os.unlink(src)
+
+def _move_file(src: Union[str, Path], dst: Union[str, Path], same_fs: bool = True) -> None:
+    """
+    Move a file, renaming it directly when source and destination share a filesystem.
+    
+    The backup directory normally lives on the same volume as the source, so
+    os.replace is enough and skips shutil's extra stat and directory probes.
+    When the volumes are known to differ, the doomed rename is not attempted.
+    
+    Args:
+        src (str | Path): File to move
+        dst (str | Path): Destination file path
+        same_fs (bool, optional): Whether both paths are on the same filesystem
+    """
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+    if same_fs:
+        try:
+            os.replace(src, dst)
+            return
+        except OSError as e:
+            # A mount point inside the tree can still make this cross-device
+            if e.errno != errno.EXDEV:
+                raise
+    _cross_device_move(src, dst)
+
+def _same_filesystem(a: Union[str, Path], b: Union[str, Path]) -> bool:
+    """
+    Check whether two paths live on the same filesystem.
+    Paths that do not exist yet are checked through their nearest existing parent.
+    
+    Args:
+        a (str | Path): First path
+        b (str | Path): Second path
+        
+    Returns:
+        bool: True if both paths are on the same device
+    """
+    def device(path: str) -> int:
+        path = os.path.abspath(path)
+        while not os.path.exists(path):
+            path = os.path.dirname(path)
+        return os.stat(path).st_dev
+    return device(os.fspath(a)) == device(os.fspath(b))
+
+def _open_archive(zip_path: Union[str, Path]) -> io.BufferedReader:
+    """
+    Open a zip file for reading through a large buffer.
+    Where supported, the kernel is told the file will be read front to back so
+    it reads ahead more aggressively.
+    
+    Args:
+        zip_path (str | Path): Zip file to open
+        
+    Returns:
+        io.BufferedReader: Open binary file, to be passed to zipfile.ZipFile
+    """
+    raw = io.BufferedReader(io.FileIO(zip_path, 'rb'), _ZIP_READ_BUFFER_SIZE)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Only a hint; some filesystems reject it
+            pass
+    return raw
+
+def _member_target(info: zipfile.ZipInfo, extract_dir: Union[str, Path]) -> Union[str, None]:
+    """
+    Work out where a zip member is extracted to.
+    
+    Member names are sanitised the same way ZipFile.extractall does it, so
+    absolute paths and '..' components cannot escape the extraction directory.
+    
+    Args:
+        info (zipfile.ZipInfo): Zip member
+        extract_dir (str | Path): Directory to extract into
+        
+    Returns:
+        str | None: Target path, or None if the name has nothing left to extract
+    """
+    # Drop drive letters, root separators and '..' parts like extractall does
+    arcname = info.filename.replace('/', os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [p for p in arcname.split(os.sep) if p not in ('', os.curdir, os.pardir)]
+    if not parts:
+        return None
+    return os.path.join(extract_dir, *parts)
+
+def _extract_zip(zip_ref: zipfile.ZipFile, extract_dir: Union[str, Path],
+                 members: List[zipfile.ZipInfo] = None) -> List[str]:
+    """
+    Extract members of an open zip file, streaming each through a 1 MiB buffer.
+    Replaces ZipFile.extractall, which copies members in small chunks.
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Open zip file to extract
+        extract_dir (str | Path): Directory to extract into
+        members (List[zipfile.ZipInfo], optional): Members to extract; defaults to all
+        
+    Returns:
+        List[str]: Paths of the extracted files
+    """
+    extracted = []
+    created_dirs = set()
+    for info in zip_ref.infolist() if members is None else members:
+        target = _member_target(info, extract_dir)
+        if target is None:
+            continue
+        
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+        
+        parent = os.path.dirname(target)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+        with zip_ref.open(info, 'r') as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=_COPY_BUFFER_SIZE)
+        extracted.append(target)
+    return extracted
+
+def _split_by_offset(files: List[zipfile.ZipInfo], count: int) -> List[List[zipfile.ZipInfo]]:
+    """
+    Split zip members into contiguous runs of the archive with similar compressed size.
+    
+    Each run covers one stretch of the file, so a thread reading it moves forward
+    through its read buffer instead of seeking back and forth across the archive.
+    
+    Args:
+        files (List[zipfile.ZipInfo]): Members to split
+        count (int): Number of runs wanted
+        
+    Returns:
+        List[List[zipfile.ZipInfo]]: Non-empty runs in archive order
+    """
+    ordered = sorted(files, key=lambda i: i.header_offset)
+    total = sum(info.compress_size for info in ordered)
+    groups = [[]]
+    done = 0
+    for info in ordered:
+        # Start the next run once this one has its share of the bytes
+        if groups[-1] and len(groups) < count and done >= total * len(groups) / count:
+            groups.append([])
+        groups[-1].append(info)
+        done += info.compress_size
+    return groups
+
+def _extract_zip_parallel(zip_ref: zipfile.ZipFile, zip_path: Union[str, Path],
+                          extract_dir: Union[str, Path]) -> List[str]:
+    """
+    Extract a large zip file with several threads, each on its own file handle.
+    
+    Members are split into contiguous runs of the archive with roughly equal
+    compressed size and each run is inflated by one thread; zlib and crc32
+    release the GIL, so the runs decompress in parallel while every thread still
+    reads its part of the file front to back. Falls back to a single thread for
+    archives that are small, have one member or repeat a member name, and while
+    another archive is already being extracted in parallel.
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Open zip file, used for its member list
+        zip_path (str | Path): Path of the zip file, reopened by each thread
+        extract_dir (str | Path): Directory to extract into
+        
+    Returns:
+        List[str]: Paths of the extracted files
+    """
+    infos = zip_ref.infolist()
+    files = [info for info in infos if not info.is_dir()]
+    targets = [_member_target(info, extract_dir) for info in files]
+    if (_MEMBER_WORKERS < 2 or len(files) < 2
+            or sum(info.file_size for info in files) < _PARALLEL_MEMBER_BYTES
+            or len(set(targets)) < len(targets)):
+        # Repeated names must be written in archive order, so stay serial
+        return _extract_zip(zip_ref, extract_dir)
+    if not _parallel_extract_lock.acquire(blocking=False):
+        # Another archive already has the extra threads
+        return _extract_zip(zip_ref, extract_dir)
+    
+    try:
+        # Directory entries first, so empty directories exist regardless of grouping
+        _extract_zip(zip_ref, extract_dir, [info for info in infos if info.is_dir()])
+        
+        groups = _split_by_offset(files, _MEMBER_WORKERS)
+        
+        def extract_group(members: List[zipfile.ZipInfo]) -> List[str]:
+            with _open_archive(zip_path) as raw, zipfile.ZipFile(raw, 'r') as group_ref:
+                return _extract_zip(group_ref, extract_dir, members)
+        
+        extracted = []
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            for paths in executor.map(extract_group, groups):
+                extracted.extend(paths)
+        return extracted
+    finally:
+        _parallel_extract_lock.release()
+
 class MediaSorter:
     """
     A class to sort and organize files by separating media and non-media content.
     Handles unzipping of archives and moving non-media files to a backup location.
     """
     
-    def __init__(self, source_dir: str, backup_dir: str):
+    def __init__(self, source_dir: str, backup_dir: str, deep_mime: bool = False):
         """
         Initialize the MediaSorter with source and backup directories.
         
         Args:
             source_dir (str): Path to the source directory containing files to sort
             backup_dir (str): Path where non-media files will be moved
+            deep_mime (bool, optional): Also treat files as media when the MIME type
+                guessed from an unlisted extension is video, audio or image
         """
         self.source_dir = Path(source_dir)
         self.backup_dir = Path(backup_dir)
+        self.deep_mime = deep_mime
+        # String forms for hot loops, where Path objects are costly to build
+        self._source_str = os.fspath(self.source_dir)
+        self._backup_str = os.fspath(self.backup_dir)
+        # Walks never descend into the backup directory
+        self._skip_dirs = frozenset({os.path.abspath(self.backup_dir)})
+        # Length of the source prefix (with separator) to slice off scanned paths
+        self._source_prefix_len = len(os.path.join(self._source_str, ''))
         self.console = Console()  # Rich console for prettier output
-        self.operations_log: List[Dict] = []  # Track all operations performed
+        # Operations are streamed to a JSON Lines file as they happen
+        self.log_file = self.backup_dir / 'operations_log.jsonl'
+        self._log_fp = None  # Opened on the first logged operation
+        self._log_lock = threading.Lock()  # Guards the log file across worker threads
+        # Entries carry the run start time plus a sequence number rather than
+        # formatting a timestamp for every operation
+        self._start_time = datetime.now().isoformat()
+        self._op_counter = 0
+        # Directories already created during this run, to skip repeat mkdir calls
+        self._ensured_dirs: Set[str] = set()
+        # Decided once so moves to the backup directory can pick rename or copy
+        self._same_fs = _same_filesystem(self.source_dir, self.backup_dir)
         
         # Define known media file extensions for quick lookup
         self.media_extensions: Set[str] = {
             # Video formats
-            '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', 
+            '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv',
+            '.m4v', '.webm', '.mpg', '.mpeg', '.3gp', '.qt',
             # Audio formats
             '.mp3', '.wav', '.flac', '.m4a', '.aac',
+            '.ogg', '.opus', '.aif', '.aiff',
             # Image formats
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'
+            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff',
+            '.tif', '.webp', '.heic', '.heif', '.avif'
         }
+        self._media_suffixes_lower = frozenset(self.media_extensions)
+        # Common spellings ('.jpg', '.JPG', '.Jpg') so most names need no .lower()
+        self._media_exts_any_case = frozenset(
+            spelling for ext in self.media_extensions
+            for spelling in (ext, ext.upper(), '.' + ext[1:].capitalize())
+        )
+        # Suffix lengths (dot included) that can possibly be media
+        self._media_suffix_lengths = frozenset(len(ext) for ext in self.media_extensions)
 
         # Zip files need special handling (extraction before processing)
-        self.zip_extensions = {'.zip', '.ZIP'}
+        self.zip_extensions = {'.zip'}  # Compared against lowercased suffixes
 
-        # Add new attribute to track person-level directories
-        self.person_dirs = {path for path in self.source_dir.iterdir() if path.is_dir()}
+        # Add new attribute to track person-level directories (the backup
+        # directory may live inside the source directory and is not a person)
+        with os.scandir(self.source_dir) as it:
+            self.person_dirs = {
+                Path(entry.path) for entry in it
+                if entry.is_dir(follow_symlinks=False)
+                and os.path.abspath(entry.path) not in self._skip_dirs
+            }
 
-    def is_media_file(self, file_path: Path) -> bool:
+    def is_media_file(self, name: Union[str, Path]) -> bool:
         """
-        Determine if a file is a media file based on extension and MIME type.
+        Determine if a file is a media file based on its extension.
         
         Args:
-            file_path (Path): Path to the file to check
+            name (str | Path): Bare file name (e.g. DirEntry.name) or path to check
             
         Returns:
             bool: True if file is a media file, False otherwise
         """
-        # First check extension for quick determination
-        if file_path.suffix.lower() in self.media_extensions:
-            return True
-        # If extension check fails, try MIME type for deeper inspection
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        return mime_type and mime_type.startswith(('video/', 'audio/', 'image/'))
+        name = os.fspath(name)
+        # Only the last path component counts, so dotted parent directories are ignored
+        start = name.rfind(os.sep) + 1
+        if os.altsep:
+            start = max(start, name.rfind(os.altsep) + 1)
+        # Same rule as Path.suffix: dotfiles like '.jpg' and names ending in
+        # a dot have no suffix
+        dot = name.rfind('.', start)
+        if dot <= start or dot == len(name) - 1:
+            return False
+        # Cheap length gate rejects most non-media suffixes without slicing
+        if len(name) - dot in self._media_suffix_lengths:
+            suffix = name[dot:]
+            # Extension allowlist; add new formats to media_extensions
+            if suffix in self._media_exts_any_case:
+                return True
+            # Only unusual mixed-case suffixes need lowercasing
+            if not suffix.islower() and suffix.lower() in self._media_suffixes_lower:
+                return True
+        # Opt-in MIME lookup for extensions outside the allowlist
+        return self.deep_mime and _mime_is_media(name[dot:].lower())
 
-    def unzip_directory(self) -> None:
+    def _report_scan_error(self, error: OSError) -> None:
         """
-        First processing phase: Extract all zip files recursively until no more are found.
-        Deletes original zip files after successful extraction.
+        Report a directory that could not be read during a walk; it is skipped.
+        
+        Args:
+            error (OSError): Error raised while listing the directory
+        """
+        self.console.print(f"[yellow]Skipping unreadable directory {error.filename}: {error.strerror}[/yellow]")
+
+    def _ensure_dir(self, directory: str) -> None:
         """
-        self.console.print("[yellow]Starting unzip phase...[/yellow]")
+        Create a directory (and parents) unless it was already created this run.
         
-        while True:
+        Args:
+            directory (str): Directory path to create
+        """
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
+    def _find_zip_files(self, path: Path) -> List[Path]:
+        """
+        Find zip files under a directory with a single case-insensitive walk.
+        Zip files inside the backup directory are ignored.
+        
+        Args:
+            path (Path): Directory to search
+            
+        Returns:
+            List[Path]: Zip files found
+        """
+        return [
+            Path(entry.path) for entry in _scandir_recursive(path, self._skip_dirs, self._report_scan_error)
+            if os.path.splitext(entry.name)[1].lower() in self.zip_extensions
+        ]
+
+    def _extract_one(self, zip_path: Path) -> List[Path]:
+        """
+        Extract a single zip file next to itself and delete the original.
+        Safe to run from worker threads.
+        
+        Args:
+            zip_path (Path): Zip file to extract
+            
+        Returns:
+            List[Path]: Zip files that were nested inside the extracted archive
+        """
+        try:
+            # Create extraction directory next to zip file
+            extract_dir = zip_path.parent / zip_path.stem
+            
+            # Ensure extraction directory exists
+            extract_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Extract contents
+            with _open_archive(zip_path) as raw, zipfile.ZipFile(raw, 'r') as zip_ref:
+                extracted = _extract_zip_parallel(zip_ref, zip_path, extract_dir)
+            
+            # Remove original zip file to save space
+            zip_path.unlink()
+            
+            # Log successful operation
+            self.log_operation('unzip', str(zip_path), destination=str(extract_dir))
+            
+            return [
+                Path(p) for p in extracted
+                if os.path.splitext(p)[1].lower() in self.zip_extensions
+            ]
+            
+        except Exception as e:
+            # Log failed operation
+            self.console.print(f"[red]Error unzipping {zip_path}: {e}[/red]")
+            self.log_operation('unzip_error', str(zip_path), error=str(e))
+            return []
+
+    def unzip_directory(self, progress: Progress = None,
+                        on_dir_ready: Callable[[Path], None] = None,
+                        stop: threading.Event = None) -> None:
+        """
+        First processing phase: Extract all zip files, including zips nested inside them.
+        Archives are extracted in parallel on a thread pool; zlib releases the GIL
+        while decompressing. Nested zips are queued as their parent finishes, so the
+        whole tree is walked once. Deletes original zip files after successful extraction.
+        
+        Args:
+            progress (Progress, optional): Progress display to add the unzip task to;
+                a new one is shown if omitted
+            on_dir_ready (Callable[[Path], None], optional): Called with each person
+                directory once every archive inside it has been extracted
+            stop (threading.Event, optional): When set, archives that have not
+                started yet are skipped; those already extracting are finished
+        """
+        # Person directories still waiting on archives, with their outstanding counts
+        persons = {p.name: p for p in self.person_dirs}
+        waiting = dict.fromkeys(persons, 0)
+
+        def release(name: str) -> None:
+            # Hand a person directory over exactly once
+            if waiting.pop(name, None) is not None and on_dir_ready is not None:
+                on_dir_ready(persons[name])
+
+        def owner(zip_path: Path) -> str:
+            # First path component of the extraction directory below the source
+            # directory; a root-level 'Alice.zip' extracts into 'Alice/'
+            extract_dir = str(zip_path.parent / zip_path.stem)
+            return extract_dir[self._source_prefix_len:].split(os.sep, 1)[0]
+
+        try:
+            self.console.print("[yellow]Starting unzip phase...[/yellow]")
+            
             # Find all zip files recursively in source directory
-            zip_files = list(self.source_dir.rglob('*.zip')) + list(self.source_dir.rglob('*.ZIP'))
+            zip_files = self._find_zip_files(self.source_dir)
+            queued = set(zip_files)
+            for zip_path in zip_files:
+                name = owner(zip_path)
+                if name in waiting:
+                    waiting[name] += 1
+            # Directories without archives can be flattened straight away
+            for name in [n for n, count in waiting.items() if count == 0]:
+                release(name)
             
             if not zip_files:
-                self.console.print("[green]No more zip files found.[/green]")
-                break
+                self.console.print("[green]No zip files found.[/green]")
+                self.console.print("[green]Unzip phase complete![/green]")
+                return
 
             total_files = len(zip_files)
             self.console.print(f"[yellow]Found {total_files} zip files to process...[/yellow]")
             
-            # Setup progress bar for current batch of zip files
-            with Progress(
-                SpinnerColumn(),
-                *Progress.get_default_columns(),
-                TimeElapsedColumn(),
-            ) as progress:
+            # Setup progress bar; its total grows as nested zips are discovered
+            with contextlib.ExitStack() as stack, \
+                    ThreadPoolExecutor(max_workers=_UNZIP_WORKERS) as executor:
+                if progress is None:
+                    progress = stack.enter_context(Progress(
+                        SpinnerColumn(),
+                        *Progress.get_default_columns(),
+                        TimeElapsedColumn(),
+                    ))
                 unzip_task = progress.add_task(
                     f"[cyan]Unzipping {total_files} files...", 
                     total=total_files
                 )
                 
-                # Process each zip file
-                for index, zip_path in enumerate(zip_files, 1):
-                    try:
-                        # Skip if the zip file is in the backup directory
-                        if str(zip_path).startswith(str(self.backup_dir)):
-                            progress.advance(unzip_task)
-                            continue
-                        
-                        # Update description to show current file
-                        progress.update(
-                            unzip_task,
-                            description=f"[cyan]Unzipping ({index}/{total_files}): {zip_path.name}"
-                        )
-                        
-                        # Create extraction directory next to zip file
-                        extract_dir = zip_path.parent / zip_path.stem
-                        
-                        # Ensure extraction directory exists
-                        extract_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        # Extract contents
-                        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                            zip_ref.extractall(extract_dir)
-                        
-                        # Remove original zip file to save space
-                        zip_path.unlink()
-                        
-                        # Log successful operation
-                        self.operations_log.append({
-                            'timestamp': datetime.now().isoformat(),
-                            'action': 'unzip',
-                            'source': str(zip_path),
-                            'destination': str(extract_dir),
-                            'status': 'success'
-                        })
-                        
-                        # Update progress
-                        progress.advance(unzip_task)
-                        
-                    except Exception as e:
-                        # Log failed operation
-                        self.console.print(f"[red]Error unzipping {zip_path}: {e}[/red]")
-                        self.operations_log.append({
-                            'timestamp': datetime.now().isoformat(),
-                            'action': 'unzip_error',
-                            'source': str(zip_path),
-                            'error': str(e)
-                        })
-                        
-                        # Still advance progress even on error
+                # Each future maps to the person directory its archive belongs to
+                pending = {
+                    executor.submit(self._extract_one, zip_path): owner(zip_path)
+                    for zip_path in zip_files
+                }
+                while pending:
+                    # Time out now and then so a stop request is noticed promptly
+                    done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    if stop is not None and stop.is_set():
+                        # Drop queued archives; running ones finish their files
+                        # before the executor shuts down
+                        for future in pending:
+                            future.cancel()
+                        self.console.print("[yellow]Unzip phase stopped.[/yellow]")
+                        return
+                    for future in done:
+                        name = pending.pop(future)
+                        # Advance progress on success and on error alike
                         progress.advance(unzip_task)
+                        # Queue any zips that were nested inside the finished archive
+                        nested_zips = [z for z in future.result() if z not in queued]
+                        if nested_zips:
+                            queued.update(nested_zips)
+                            total_files += len(nested_zips)
+                            progress.update(
+                                unzip_task,
+                                description=f"[cyan]Unzipping {total_files} files...",
+                                total=total_files
+                            )
+                            for zip_path in nested_zips:
+                                pending[executor.submit(self._extract_one, zip_path)] = name
+                            if name in waiting:
+                                waiting[name] += len(nested_zips)
+                        if name in waiting:
+                            waiting[name] -= 1
+                            if waiting[name] == 0:
+                                release(name)
+
+            self.console.print("[green]Unzip phase complete![/green]")
+        finally:
+            # After an error, hand over whatever is left so it still gets flattened
+            for name in list(waiting):
+                release(name)
 
-        self.console.print("[green]Unzip phase complete![/green]")
+    def _unzip_into_queue(self, progress: Progress, ready_queue: queue.Queue,
+                          stop: threading.Event = None) -> None:
+        """
+        Run the unzip phase and put each person directory on a queue once its
+        archives are extracted. Runs on a background thread; puts None on the
+        queue when the phase ends.
+        
+        Args:
+            progress (Progress): Progress display to add the unzip task to
+            ready_queue (queue.Queue): Queue receiving person directory paths
+            stop (threading.Event, optional): Set to stop before the next archive
+        """
+        try:
+            self.unzip_directory(progress, ready_queue.put, stop)
+        except Exception as e:
+            self.console.print(f"[red]Error during unzip phase: {e}[/red]")
+        finally:
+            ready_queue.put(None)
+
+    def _iter_nonmedia(self) -> Iterator[Tuple[str, str, int]]:
+        """
+        Walk the source directory and yield every non-media file.
+        The backup directory and its contents are skipped.
+        
+        Yields:
+            Tuple[str, str, int]: (full path, path relative to source, size) for each file
+        """
+        for entry in _scandir_recursive(self.source_dir, self._skip_dirs, self._report_scan_error):
+            if not self.is_media_file(entry.name):
+                try:
+                    size = entry.stat().st_size
+                except FileNotFoundError:
+                    # Ignore files that disappeared during the scan
+                    continue
+                yield entry.path, entry.path[self._source_prefix_len:], size
+
+    def _scan(self) -> Tuple[List[Tuple[str, str, int]], int]:
+        """
+        Walk the source directory once, planning a move for every non-media
+        file and summing their sizes in the same pass.
+        
+        Returns:
+            Tuple[List[Tuple[str, str, int]], int]: (source, destination, size)
+                for each file, and the total size in bytes
+        """
+        planned_ops = []
+        total_size = 0
+        for src, rel_path, size in self._iter_nonmedia():
+            planned_ops.append((src, os.path.join(self._backup_str, rel_path), size))
+            total_size += size
+        return planned_ops, total_size
 
-    def calculate_total_size(self, path: Path) -> int:
+    def calculate_total_size(self, path: Union[str, Path] = None) -> int:
         """
         Calculate total size of all non-media files for progress tracking.
         
         Args:
-            path (Path): Directory to scan
+            path (str | Path, optional): Directory to scan; defaults to the source directory
             
         Returns:
             int: Total size in bytes
         """
-        total = 0
         self.console.print("[yellow]Calculating total size...[/yellow]")
-        for item in path.rglob('*'):
-            if item.is_file() and not self.is_media_file(item):
-                total += item.stat().st_size
+        total = 0
+        for entry in _scandir_recursive(self.source_dir if path is None else path,
+                                        self._skip_dirs, self._report_scan_error):
+            if not self.is_media_file(entry.name):
+                try:
+                    total += entry.stat().st_size
+                except FileNotFoundError:
+                    # Ignore files that disappeared during the scan
+                    continue
         self.console.print(f"[green]Total size to process: {total / 1024 / 1024:.2f} MB[/green]")
         return total
 
@@ -172,37 +759,36 @@ class MediaSorter:
         Returns:
             List[Dict]: List of planned file movements
         """
-        planned_operations = []
-        for item in self.source_dir.rglob('*'):
-            if item.is_file() and not self.is_media_file(item):
-                rel_path = item.relative_to(self.source_dir)
-                planned_operations.append({
-                    'action': 'move',
-                    'source': str(item),
-                    'destination': str(self.backup_dir / rel_path)
-                })
-        return planned_operations
+        planned_ops, _ = self._scan()
+        return [
+            {'action': 'move', 'source': src, 'destination': dest}
+            for src, dest, _ in planned_ops
+        ]
 
-    def process_file(self, item: Path) -> bool:
+    def process_file(self, item: Union[str, Path], dest_path: Union[str, Path] = None) -> bool:
         """
         Process a single file, moving it if it's a non-media file.
+        Safe to run from worker threads.
         
         Args:
-            item (Path): Path to the file to process
+            item (str | Path): Path to the file to process
+            dest_path (str | Path, optional): Destination in the backup directory;
+                derived from the file's path relative to the source if omitted
             
         Returns:
             bool: True if processing was successful, False otherwise
         """
         try:
-            rel_path = item.relative_to(self.source_dir)
-            dest_path = self.backup_dir / rel_path
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            if dest_path is None:
+                rel_path = Path(item).relative_to(self.source_dir)
+                dest_path = self.backup_dir / rel_path
+            self._ensure_dir(os.path.dirname(dest_path))
             
             # Move the file instead of copy+delete
-            shutil.move(str(item), str(dest_path))
+            _move_file(item, dest_path, self._same_fs)
             
             # Log successful operation
-            self.log_operation('move', str(item), destination=str(dest_path))
+            self.log_operation('move', os.fspath(item), destination=os.fspath(dest_path))
             return True
             
         except FileNotFoundError:
@@ -221,7 +807,7 @@ class MediaSorter:
     def log_operation(self, action: str, source: str, error: str = None, 
                      destination: str = None, silent: bool = False) -> None:
         """
-        Log an operation to the operations log.
+        Log an operation by appending one JSON line to the operations log file.
         
         Args:
             action (str): Type of action performed
@@ -231,7 +817,9 @@ class MediaSorter:
             silent (bool, optional): Whether to skip logging FileNotFoundError
         """
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            't0': self._start_time,
+            'seq': None,  # Assigned under the lock so entries are numbered in write order
+            'ts': time.time(),  # Epoch seconds; cheaper than formatting a datetime per entry
             'action': action,
             'source': source
         }
@@ -244,154 +832,276 @@ class MediaSorter:
         
         # Only add to operations log if it's not a silenced FileNotFoundError
         if not (silent and "No such file or directory" in str(error)):
-            self.operations_log.append(log_entry)
+            with self._log_lock:
+                log_entry['seq'] = self._op_counter
+                self._op_counter += 1
+                line = _encode_log_line(log_entry)
+                if self._log_fp is None:
+                    self.backup_dir.mkdir(parents=True, exist_ok=True)
+                    self._log_fp = open(self.log_file, 'ab', buffering=1 << 16)
+                self._log_fp.write(line)
+
+    def close_log(self, sync: bool = False) -> None:
+        """
+        Flush and close the operations log file. Logging again reopens it.
+        
+        Args:
+            sync (bool, optional): Also fsync the file so it survives the drive
+                being unplugged right after the script stops
+        """
+        with self._log_lock:
+            if self._log_fp is not None:
+                if sync:
+                    self._log_fp.flush()
+                    os.fsync(self._log_fp.fileno())
+                self._log_fp.close()
+                self._log_fp = None
 
-    def flatten_media_files(self) -> None:
+    def _do_move(self, move: Tuple[str, str], action: str, label: str,
+                 progress: Progress, task_id, same_fs: bool = True,
+                 slots: threading.BoundedSemaphore = None) -> None:
+        """
+        Move one file during the flattening phase and log the result.
+        Safe to run from worker threads.
+        
+        Args:
+            move (Tuple[str, str]): Source and destination paths
+            action (str): Action name to record in the operations log
+            label (str): Kind of file, used in error messages
+            progress (Progress): Progress display to advance
+            task_id: Progress task to advance once the move is done
+            same_fs (bool, optional): Whether source and destination share a filesystem
+            slots (threading.BoundedSemaphore, optional): Released once the move
+                is done, to let the submitter queue another one
+        """
+        old_path, new_path = move
+        try:
+            self._ensure_dir(os.path.dirname(new_path))
+            _move_file(old_path, new_path, same_fs)
+            self.log_operation(action, old_path, destination=new_path)
+        except Exception as e:
+            self.console.print(f"[red]Error moving {label} file {old_path}: {e}[/red]")
+        finally:
+            if slots is not None:
+                slots.release()
+        progress.advance(task_id)
+
+    def _scan_into_queue(self, person_dir: str, scan_queue: queue.Queue) -> None:
+        """
+        Walk a person directory and put each file entry on a queue.
+        Runs on a background thread; puts None on the queue when the walk ends.
+        
+        Args:
+            person_dir (str): Person directory to walk
+            scan_queue (queue.Queue): Queue receiving os.DirEntry objects
+        """
+        try:
+            for entry in _scandir_recursive(person_dir, self._skip_dirs, self._report_scan_error):
+                scan_queue.put(entry)
+        except Exception as e:
+            self.console.print(f"[red]Error scanning {person_dir}: {e}[/red]")
+        finally:
+            scan_queue.put(None)
+
+    def flatten_media_files(self, progress: Progress = None,
+                            person_dirs: Iterable[Path] = None) -> None:
         """
         Flatten all media files into their respective person-level directories.
         Move all non-media files to backup directory.
+        
+        Args:
+            progress (Progress, optional): Progress display to add tasks to;
+                a new one is shown if omitted
+            person_dirs (Iterable[Path], optional): Person directories to flatten,
+                in the order they become available; defaults to all of them
         """
         self.console.print("[yellow]Starting media file flattening...[/yellow]")
+        if person_dirs is None:
+            person_dirs = self.person_dirs
         
-        with Progress(
-            SpinnerColumn(),
-            *Progress.get_default_columns(),
-            TimeElapsedColumn(),
-        ) as progress:
-            # First pass: Move all media files to person directory root
-            media_moves = []
-            nonmedia_moves = []
+        with contextlib.ExitStack() as stack:
+            if progress is None:
+                progress = stack.enter_context(Progress(
+                    SpinnerColumn(),
+                    *Progress.get_default_columns(),
+                    TimeElapsedColumn(),
+                ))
+            self.console.print("[yellow]Scanning and moving files...[/yellow]")
             
-            self.console.print("[yellow]Scanning all files...[/yellow]")
+            # Totals grow as the scanner discovers files
+            move_task = progress.add_task("[cyan]Moving files...", total=0)
+            media_count = 0
+            nonmedia_count = 0
             
-            # Process each person directory
-            for person_dir in self.person_dirs:
-                # Recursively find ALL files first
-                all_files = list(person_dir.rglob('*'))
-                scan_task = progress.add_task(
-                    f"[cyan]Scanning {person_dir.name}...",
-                    total=len(all_files)
-                )
-                
-                for item in all_files:
-                    if item.is_file():
-                        if self.is_media_file(item):
+            # Moves start while the scan is still running, so scan and move
+            # latency overlap instead of adding up. The scanner blocks on its
+            # queue and submissions block on the semaphore, so memory stays
+            # bounded however many files there are.
+            slots = threading.BoundedSemaphore(_MAX_PENDING_MOVES)
+            with ThreadPoolExecutor(max_workers=_MOVE_WORKERS) as executor:
+                # Process each person directory
+                for person_dir in person_dirs:
+                    # Joined onto the source string so scanned paths share its prefix
+                    person_str = os.path.join(self._source_str, person_dir.name)
+                    # Names already taken in the person directory root, plus names
+                    # handed out below. Compared lowercased since the source volume
+                    # may be case-insensitive.
+                    try:
+                        with os.scandir(person_str) as it:
+                            reserved = {e.name.lower() for e in it}
+                    except OSError as e:
+                        # Leave unreadable person directories alone
+                        self._report_scan_error(e)
+                        continue
+                    
+                    # Walk the person directory on a background thread
+                    scan_queue = queue.Queue(maxsize=10000)
+                    scanner = threading.Thread(
+                        target=self._scan_into_queue,
+                        args=(person_str, scan_queue),
+                        daemon=True
+                    )
+                    scanner.start()
+                    
+                    last_update = 0.0
+                    while True:
+                        entry = scan_queue.get()
+                        if entry is None:
+                            break
+                        src = entry.path
+                        if self.is_media_file(entry.name):
+                            # Media files already at the person directory root stay put
+                            if os.path.dirname(src) == person_str:
+                                continue
                             # Always move media files to person directory root
-                            new_path = person_dir / item.name
+                            candidate = entry.name
                             # Handle duplicate filenames
+                            stem, suffix = os.path.splitext(entry.name)
                             counter = 1
-                            while new_path.exists():
-                                stem = item.stem
-                                suffix = item.suffix
-                                new_path = person_dir / f"{stem}_{counter}{suffix}"
+                            while candidate.lower() in reserved:
+                                candidate = f"{stem}_{counter}{suffix}"
                                 counter += 1
-                            media_moves.append((item, new_path))
+                            reserved.add(candidate.lower())
+                            move = (src, os.path.join(person_str, candidate))
+                            action, label, same_fs = 'flatten_media', 'media', True
+                            media_count += 1
                         else:
                             # Move non-media files to backup directory
-                            rel_path = item.relative_to(self.source_dir)
-                            backup_path = self.backup_dir / rel_path
-                            nonmedia_moves.append((item, backup_path))
-                    progress.advance(scan_task)
-
-            # First move all media files to root
-            if media_moves:
-                self.console.print(f"[yellow]Moving {len(media_moves)} media files to root...[/yellow]")
-                media_task = progress.add_task(
-                    "[cyan]Moving media files...",
-                    total=len(media_moves)
-                )
-                
-                for old_path, new_path in media_moves:
-                    try:
-                        new_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.move(str(old_path), str(new_path))
-                        self.log_operation('flatten_media', str(old_path), destination=str(new_path))
-                    except Exception as e:
-                        self.console.print(f"[red]Error moving media file {old_path}: {e}[/red]")
-                    progress.advance(media_task)
-
-            # Then move all non-media files
-            if nonmedia_moves:
-                self.console.print(f"[yellow]Moving {len(nonmedia_moves)} non-media files...[/yellow]")
-                nonmedia_task = progress.add_task(
-                    "[cyan]Moving non-media files...",
-                    total=len(nonmedia_moves)
-                )
-                
-                for old_path, new_path in nonmedia_moves:
-                    try:
-                        new_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.move(str(old_path), str(new_path))
-                        self.log_operation('move_nonmedia', str(old_path), destination=str(new_path))
-                    except Exception as e:
-                        self.console.print(f"[red]Error moving non-media file {old_path}: {e}[/red]")
-                    progress.advance(nonmedia_task)
+                            rel_path = src[self._source_prefix_len:]
+                            move = (src, os.path.join(self._backup_str, rel_path))
+                            action, label, same_fs = 'move_nonmedia', 'non-media', self._same_fs
+                            nonmedia_count += 1
+                        slots.acquire()
+                        try:
+                            executor.submit(self._do_move, move, action, label,
+                                            progress, move_task, same_fs, slots)
+                        except Exception:
+                            slots.release()
+                            raise
+                        # Grow the total in batches rather than once per file
+                        now = time.monotonic()
+                        if now - last_update >= _PROGRESS_INTERVAL:
+                            progress.update(move_task, total=media_count + nonmedia_count)
+                            last_update = now
+                    
+                    scanner.join()
+                    progress.update(move_task, total=media_count + nonmedia_count)
+
+            self.console.print(
+                f"[yellow]Processed {media_count} media files and "
+                f"{nonmedia_count} non-media files.[/yellow]"
+            )
 
             # Finally, clean up empty directories
             self.console.print("[yellow]Cleaning up empty directories...[/yellow]")
             
-            # Get all subdirectories in person directories
-            all_dirs = set()
-            for person_dir in self.person_dirs:
-                for dir_path in person_dir.rglob('*'):
-                    if dir_path.is_dir():
-                        all_dirs.add(dir_path)
-
-            # Sort directories by depth (deepest first)
-            sorted_dirs = sorted(all_dirs, 
-                               key=lambda x: len(str(x).split(os.sep)), 
-                               reverse=True)
-            
+            # Indeterminate progress: directories are counted as the walk visits them
             cleanup_task = progress.add_task(
                 "[cyan]Removing empty directories...",
-                total=len(sorted_dirs)
+                total=None
             )
             
-            for directory in sorted_dirs:
-                try:
-                    if directory not in self.person_dirs:  # Don't remove person-level directories
-                        # Check if directory contains any files (recursively)
-                        has_files = False
-                        for _, _, files in os.walk(directory):
-                            if files:
-                                has_files = True
-                                break
-                        
-                        if not has_files:
-                            shutil.rmtree(directory)
-                            self.log_operation('remove_directory', str(directory))
-                except Exception as e:
-                    self.console.print(f"[red]Error removing directory {directory}: {e}[/red]")
-                progress.advance(cleanup_task)
+            for person_dir in self.person_dirs:
+                person_str = os.path.join(self._source_str, person_dir.name)
+                # Bottom-up walk visits children before parents, so one pass
+                # removes whole chains of empty directories
+                removed = set()
+                for root, dirs, files in os.walk(person_str, topdown=False):
+                    # Don't remove person-level directories
+                    if root != person_str and not files and all(
+                        os.path.join(root, d) in removed for d in dirs
+                    ):
+                        try:
+                            os.rmdir(root)
+                            removed.add(root)
+                            self.log_operation('remove_directory', root)
+                        except Exception as e:
+                            self.console.print(f"[red]Error removing directory {root}: {e}[/red]")
+                    progress.advance(cleanup_task)
+
+            # Removed directories may have been cached as already created
+            self._ensured_dirs.clear()
 
         self.console.print("[green]Media file flattening complete![/green]")
 
-    def process_directory(self, dry_run: bool = False) -> None:
-        """Main processing function."""
+    def process_directory(self, dry_run: bool = False, preview_limit: int = None) -> None:
+        """
+        Main processing function.
+        
+        Args:
+            dry_run (bool, optional): Only list the planned moves
+            preview_limit (int, optional): Maximum number of planned moves to list
+                in a dry run; all of them are listed if omitted
+        """
         try:
             # Create backup directory if it doesn't exist
             self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-            # Get absolute path of NonMedia directory
-            nonmedia_abs_path = os.path.abspath(self.backup_dir)
-
             # First, handle all zip files
             if not dry_run:
-                self.unzip_directory()
-                # Add flattening step after unzipping
-                self.flatten_media_files()
+                with Progress(
+                    SpinnerColumn(),
+                    *Progress.get_default_columns(),
+                    TimeElapsedColumn(),
+                ) as progress:
+                    # Flatten each person directory as soon as its archives are
+                    # extracted, while the remaining archives are still unzipping
+                    ready_queue = queue.Queue()
+                    stop_unzip = threading.Event()
+                    unzipper = threading.Thread(
+                        target=self._unzip_into_queue,
+                        args=(progress, ready_queue, stop_unzip)
+                    )
+                    unzipper.start()
+                    try:
+                        self.flatten_media_files(progress, iter(ready_queue.get, None))
+                    except BaseException:
+                        # Let the archives being written finish, but start no more
+                        stop_unzip.set()
+                        raise
+                    finally:
+                        unzipper.join()
 
-            # Then do a dry run and show planned operations
-            planned_ops = self.dry_run()
-            
             if dry_run:
+                # Stream the preview straight from the walk; nothing is kept in memory
                 self.console.print("\n[yellow]Dry run results:[/yellow]")
-                for op in planned_ops:
-                    self.console.print(f"Would move: {op['source']} -> {op['destination']}")
+                count = 0
+                total_size = 0
+                for src, rel_path, size in self._iter_nonmedia():
+                    if preview_limit is None or count < preview_limit:
+                        dest = os.path.join(self._backup_str, rel_path)
+                        self.console.print(f"Would move: {src} -> {dest}")
+                    count += 1
+                    total_size += size
+                if preview_limit is not None and count > preview_limit:
+                    self.console.print(f"... and {count - preview_limit} more")
+                self.console.print(f"[yellow]{count} files, {total_size / 1024 / 1024:.2f} MB in total[/yellow]")
                 return
 
-            # Calculate total size for progress bar
-            total_size = self.calculate_total_size(self.source_dir)
+            # Walk the tree once; the size total and moves share it
+            planned_ops, total_size = self._scan()
+
+            self.console.print(f"[green]Total size to process: {total_size / 1024 / 1024:.2f} MB[/green]")
             processed_size = 0
 
             # Confirm with user
@@ -407,39 +1117,52 @@ class MediaSorter:
             ) as progress:
                 task = progress.add_task("[cyan]Processing...", total=total_size)
 
-                for item in self.source_dir.rglob('*'):
-                    # Skip the NonMedia directory and its contents
-                    if str(item).startswith(nonmedia_abs_path):
-                        continue
-                        
-                    if item.is_file() and not self.is_media_file(item):
-                        if self.process_file(item):
-                            # Update progress only for successful operations
-                            try:
-                                file_size = item.stat().st_size
+                # Create every destination directory up front, once each and
+                # parents first, so workers only rename
+                for directory in sorted({os.path.dirname(dest) for _, dest, _ in planned_ops}):
+                    self._ensure_dir(directory)
+
+                with ThreadPoolExecutor(max_workers=_MOVE_WORKERS) as executor:
+                    # Keep only a window of moves queued, so on Ctrl-C the executor
+                    # finishes those few instead of the whole plan
+                    ops = iter(planned_ops)
+                    pending = {}
+                    last_update = 0.0
+                    while True:
+                        for src, dest, file_size in itertools.islice(ops, _MAX_PENDING_MOVES - len(pending)):
+                            pending[executor.submit(self.process_file, src, dest)] = file_size
+                        if not pending:
+                            break
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            file_size = pending.pop(future)
+                            if future.result():
+                                # Update progress only for successful operations
                                 processed_size += file_size
-                                progress.update(task, completed=processed_size)
-                            except FileNotFoundError:
-                                # Ignore files that disappeared during processing
-                                pass
+                        # Coalesce updates; the bar only repaints a few times a second
+                        now = time.monotonic()
+                        if now - last_update >= _PROGRESS_INTERVAL:
+                            progress.update(task, completed=processed_size)
+                            last_update = now
+                    progress.update(task, completed=processed_size)
 
-            # Save operations log
-            log_file = self.backup_dir / 'operations_log.json'
-            with open(log_file, 'w') as f:
-                json.dump(self.operations_log, f, indent=2)
+            # Flush the streamed operations log
+            self.close_log()
 
             self.console.print("[green]Processing complete![/green]")
-            self.console.print(f"[blue]Operations log saved to: {log_file}[/blue]")
+            self.console.print(f"[blue]Operations log saved to: {self.log_file}[/blue]")
             
         except KeyboardInterrupt:
             self.console.print("\n[red]Process interrupted by user. Cleaning up...[/red]")
-            # Save partial operations log
-            log_file = self.backup_dir / 'operations_log_interrupted.json'
-            with open(log_file, 'w') as f:
-                json.dump(self.operations_log, f, indent=2)
-            self.console.print("[yellow]Partial operations log saved.[/yellow]")
+            # Entries are already on disk or buffered; flush what is buffered and
+            # sync it, since an interrupted run is often followed by ejecting the drive
+            self.close_log(sync=True)
+            self.console.print(f"[yellow]Partial operations log saved to: {self.log_file}[/yellow]")
             # Exit the entire Python process
             os._exit(1)  # Using os._exit() instead of sys.exit()
+        
+        finally:
+            self.close_log()
 
 if __name__ == "__main__":
     try:
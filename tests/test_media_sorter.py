@@ -0,0 +1,211 @@
+import builtins
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+import media_sorter  # noqa: E402
+from media_sorter import MediaSorter  # noqa: E402
+
+
+class MediaSorterTest(unittest.TestCase):
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.backup = os.path.join(self.source, 'NonMedia')
+        self.addCleanup(shutil.rmtree, self.source, ignore_errors=True)
+
+    def run_sorter(self):
+        sorter = MediaSorter(self.source, self.backup)
+        with mock.patch.object(builtins, 'input', return_value='y'):
+            sorter.process_directory()
+        return sorter
+
+    def test_root_zip_named_after_person_is_flattened(self):
+        # Alice.zip extracts into Alice/, so Alice/ must wait for it
+        os.makedirs(os.path.join(self.source, 'Alice', 'old'))
+        with open(os.path.join(self.source, 'Alice', 'old', 'a.jpg'), 'wb') as f:
+            f.write(b'a')
+        with zipfile.ZipFile(os.path.join(self.source, 'Alice.zip'), 'w') as z:
+            for i in range(60):
+                z.writestr(f'trip/p{i}.jpg', b'p' * 1000)
+
+        self.run_sorter()
+
+        names = os.listdir(os.path.join(self.source, 'Alice'))
+        self.assertEqual(
+            sorted(names),
+            sorted(['a.jpg'] + [f'p{i}.jpg' for i in range(60)])
+        )
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'), 'needs os.copy_file_range')
+    def test_cross_device_move_survives_zero_length_copy_file_range(self):
+        src = os.path.join(self.source, 'doc.pdf')
+        dst = os.path.join(self.source, 'moved.pdf')
+        with open(src, 'wb') as f:
+            f.write(b'x' * 5000)
+
+        with mock.patch.object(media_sorter.os, 'copy_file_range', return_value=0):
+            media_sorter._cross_device_move(src, dst)
+
+        self.assertFalse(os.path.exists(src))
+        with open(dst, 'rb') as f:
+            self.assertEqual(f.read(), b'x' * 5000)
+
+    def test_unreadable_directory_is_skipped(self):
+        os.makedirs(os.path.join(self.source, 'Alice', 'locked'))
+        os.makedirs(os.path.join(self.source, 'Alice', 'docs'))
+        with open(os.path.join(self.source, 'Alice', 'docs', 'notes.txt'), 'w') as f:
+            f.write('n')
+        real_scandir = os.scandir
+
+        def scandir(path='.'):
+            # Running as root ignores permission bits, so deny the listing here
+            if os.path.basename(os.fspath(path)) == 'locked':
+                raise PermissionError(13, 'Permission denied', os.fspath(path))
+            return real_scandir(path)
+
+        with mock.patch.object(media_sorter.os, 'scandir', side_effect=scandir):
+            sorter = MediaSorter(self.source, self.backup)
+            sorter.process_directory(dry_run=True)
+            with mock.patch.object(builtins, 'input', return_value='y'):
+                sorter.process_directory()
+
+        self.assertTrue(os.path.exists(os.path.join(self.backup, 'Alice', 'docs', 'notes.txt')))
+
+    def test_unreadable_person_directory_is_skipped(self):
+        os.makedirs(os.path.join(self.source, '.Trashes'))
+        os.makedirs(os.path.join(self.source, 'Alice', 'trip'))
+        with open(os.path.join(self.source, 'Alice', 'trip', 'p.jpg'), 'wb') as f:
+            f.write(b'p')
+        real_scandir = os.scandir
+
+        def scandir(path='.'):
+            if os.path.basename(os.fspath(path)) == '.Trashes':
+                raise PermissionError(13, 'Permission denied', os.fspath(path))
+            return real_scandir(path)
+
+        with mock.patch.object(media_sorter.os, 'scandir', side_effect=scandir):
+            self.run_sorter()
+
+        self.assertEqual(os.listdir(os.path.join(self.source, 'Alice')), ['p.jpg'])
+
+    def test_calculate_total_size_scans_given_path(self):
+        os.makedirs(os.path.join(self.source, 'Alice'))
+        os.makedirs(os.path.join(self.source, 'Bob'))
+        with open(os.path.join(self.source, 'Alice', 'a.txt'), 'wb') as f:
+            f.write(b'a' * 10)
+        with open(os.path.join(self.source, 'Alice', 'a.jpg'), 'wb') as f:
+            f.write(b'j' * 100)
+        with open(os.path.join(self.source, 'Bob', 'b.txt'), 'wb') as f:
+            f.write(b'b' * 1000)
+        sorter = MediaSorter(self.source, self.backup)
+
+        self.assertEqual(sorter.calculate_total_size(Path(self.source) / 'Alice'), 10)
+        self.assertEqual(sorter.calculate_total_size(), 1010)
+
+    def test_is_media_file_uses_suffix_of_file_name_only(self):
+        sorter = MediaSorter(self.source, self.backup)
+
+        self.assertTrue(sorter.is_media_file('beach.jpg'))
+        self.assertTrue(sorter.is_media_file('CLIP.MP4'))
+        self.assertTrue(sorter.is_media_file(os.path.join('a.b', 'beach.jpg')))
+        # Dotfiles have no suffix, like Path('.jpg').suffix
+        self.assertFalse(sorter.is_media_file('.jpg'))
+        self.assertFalse(sorter.is_media_file('.MP4'))
+        self.assertFalse(sorter.is_media_file(os.path.join('photos', '.jpg')))
+        # A dot in a parent directory is not the file's suffix
+        self.assertFalse(sorter.is_media_file(os.path.join('trip.jpg', 'notes')))
+        self.assertFalse(sorter.is_media_file('photo.'))
+
+    def test_unzip_thread_stops_cleanly_when_flatten_fails(self):
+        person = os.path.join(self.source, 'Alice')
+        os.makedirs(person)
+        for i in range(30):
+            with zipfile.ZipFile(os.path.join(person, f'z{i}.zip'), 'w') as z:
+                for j in range(5):
+                    z.writestr(f'f{j}.txt', b'x' * 10000)
+        threads_before = threading.active_count()
+        sorter = MediaSorter(self.source, self.backup)
+
+        with mock.patch.object(MediaSorter, 'flatten_media_files', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                sorter.process_directory()
+
+        # The unzip thread was joined, and every archive is either untouched
+        # or fully extracted
+        self.assertEqual(threading.active_count(), threads_before)
+        for i in range(30):
+            zip_path = os.path.join(person, f'z{i}.zip')
+            if os.path.exists(zip_path):
+                continue
+            extract_dir = os.path.join(person, f'z{i}')
+            for j in range(5):
+                with open(os.path.join(extract_dir, f'f{j}.txt'), 'rb') as f:
+                    self.assertEqual(f.read(), b'x' * 10000)
+
+    def test_flatten_renames_colliding_media_names(self):
+        person = os.path.join(self.source, 'Alice')
+        for sub in ('trip', 'party', 'work'):
+            os.makedirs(os.path.join(person, sub))
+        with open(os.path.join(person, 'beach.jpg'), 'wb') as f:
+            f.write(b'root')
+        with open(os.path.join(person, 'trip', 'beach.jpg'), 'wb') as f:
+            f.write(b'trip')
+        # Case-insensitive volumes treat these as the same name
+        with open(os.path.join(person, 'party', 'BEACH.jpg'), 'wb') as f:
+            f.write(b'party')
+        with open(os.path.join(person, 'work', 'beach.jpg'), 'wb') as f:
+            f.write(b'work')
+
+        sorter = MediaSorter(self.source, self.backup)
+        sorter.flatten_media_files()
+        sorter.close_log()
+
+        names = sorted(os.listdir(person))
+        self.assertEqual(len(names), 4)
+        self.assertEqual(len({n.lower() for n in names}), 4)
+        self.assertIn('beach.jpg', names)
+        contents = set()
+        for name in names:
+            with open(os.path.join(person, name), 'rb') as f:
+                contents.add(f.read())
+        self.assertEqual(contents, {b'root', b'trip', b'party', b'work'})
+        # The file already at the root keeps its name and contents
+        with open(os.path.join(person, 'beach.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), b'root')
+
+    def test_is_media_file_deep_mime(self):
+        plain = MediaSorter(self.source, self.backup)
+        deep = MediaSorter(self.source, self.backup, deep_mime=True)
+
+        for sorter in (plain, deep):
+            self.assertTrue(sorter.is_media_file('clip.MOV'))
+            self.assertFalse(sorter.is_media_file('report.pdf'))
+            self.assertFalse(sorter.is_media_file('README'))
+        # '.svg' is not in the allowlist but guesses as image/svg+xml
+        self.assertFalse(plain.is_media_file('logo.svg'))
+        self.assertTrue(deep.is_media_file('logo.svg'))
+        self.assertTrue(deep.is_media_file('LOGO.SVG'))
+
+    def test_split_by_offset_gives_contiguous_runs(self):
+        infos = []
+        for i, size in enumerate([500, 10, 10, 300, 50, 50, 50, 900, 5, 5, 5, 100]):
+            info = zipfile.ZipInfo(f'm{i}')
+            info.header_offset = i * 1000
+            info.compress_size = size
+            infos.append(info)
+        shuffled = infos[5:] + infos[:5]
+
+        for count in (1, 2, 4, 20):
+            groups = media_sorter._split_by_offset(shuffled, count)
+            self.assertLessEqual(len(groups), count)
+            self.assertTrue(all(groups))
+            # Concatenated runs give every member once, in archive order
+            self.assertEqual([i for group in groups for i in group], infos)